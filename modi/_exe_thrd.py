@@ -9,7 +9,7 @@ class ExeThrd(th.Thread):
     """
 
     def __init__(self, modules, topology_data, conn_task):
-        super().__init__(daemon=True)
+        super().__init__(daemon=True, name='pymodi-executor')
         conn_task.open_conn()
         self.__exe_task = ExeTask(
             modules, topology_data, conn_task
@@ -18,6 +18,10 @@ class ExeThrd(th.Thread):
 
     def close(self):
         self.__kill_sig = True
+        # recv may be waiting on the connection, let it return before the
+        # connection gets closed underneath it
+        if self.is_alive() and th.current_thread() is not self:
+            self.join(timeout=1)
 
     def run(self) -> None:
         """ Run executor task
@@ -5,15 +5,14 @@ import time
 import atexit
 import logging
 
+from copy import copy
 from importlib import import_module as im
 
 from modi._exe_thrd import ExeThrd
 from modi.util.connection_util import is_network_module_connected, is_on_pi
-from modi.util.miscellaneous import ModuleList
+from modi.util.miscellaneous import ModuleIndex, ModuleList
 from modi.util.stranger import check_complete
 from modi.util.topology_manager import TopologyManager
-from modi.util.firmware_updater import STM32FirmwareUpdater
-from modi.util.firmware_updater import ESP32FirmwareUpdater
 
 from modi.about import __version__
 
@@ -28,8 +27,9 @@ class MODI:
             raise ValueError(
                 "Virtual modules can only be defined in virtual connection"
             )
-        self._modules = list()
+        self._modules = ModuleIndex()
         self._topology_data = dict()
+        self.__module_lists = dict()
 
         self._conn = self.__init_task(
             conn_type, verbose, port, network_uuid,
@@ -45,9 +45,13 @@ class MODI:
             self._topology_data, self._modules
         )
 
+        # Poll with an exponential backoff (5 ms up to 100 ms), so that small
+        # topologies are detected early without polling fast for long
         init_time = time.time()
+        delay = 0.005
         while not self._topology_manager.is_topology_complete():
-            time.sleep(0.1)
+            time.sleep(delay)
+            delay = min(delay * 2, 0.1)
             if time.time() - init_time > 5:
                 print("MODI init timeout over. "
                       "Check your module connection.")
@@ -111,7 +115,8 @@ class MODI:
         conn_type, verbose, port, network_uuid,
     ):
         if not conn_type:
-            is_can = not is_network_module_connected() and is_on_pi()
+            # Only a Pi can talk over CAN, skip the port scan elsewhere
+            is_can = is_on_pi() and not is_network_module_connected()
             conn_type = 'can' if is_can else 'ser'
 
         if conn_type == 'ser':
@@ -135,7 +140,6 @@ class MODI:
         self._exe_thrd = ExeThrd(
             self._modules, self._topology_data, self._conn
         )
-        self._conn.open_conn()
         self._exe_thrd.start()
 
     def close(self):
@@ -158,7 +162,10 @@ class MODI:
         :return: Json msg received
         :rtype: str if msg exists, else None
         """
-        return self._conn.recv()
+        json_pkt = self._conn.recv()
+        if isinstance(json_pkt, bytes):
+            return json_pkt.decode('utf8')
+        return json_pkt
 
     def print_topology_map(self, print_id=False):
         """Prints out the topology map
@@ -168,95 +175,114 @@ class MODI:
         """
         self._topology_manager.print_topology_map(print_id)
 
+    def __module_list(self, module_type=None) -> ModuleList:
+        """Returns a copy of the cached ModuleList of the given module type,
+        which is rebuilt only when a module has been added since it was cached
+
+        :param module_type: Type of the modules, all modules if None
+        :return: ModuleList
+        """
+        nb_modules = len(self._modules)
+        cached = self.__module_lists.get(module_type)
+        if not cached or cached[0] != nb_modules:
+            cached = (nb_modules, ModuleList(self._modules, module_type))
+            self.__module_lists[module_type] = cached
+        # Copy, so that callers mutating the list do not alter the cache
+        return copy(cached[1])
+
     @property
     def modules(self) -> ModuleList:
         """Module List of connected modules except network module.
         """
-        return ModuleList(self._modules)
+        return self.__module_list()
 
     @property
     def networks(self) -> ModuleList:
-        return ModuleList(self._modules, 'network')
+        return self.__module_list('network')
 
     @property
     def buttons(self) -> ModuleList:
         """Module List of connected Button modules.
         """
-        return ModuleList(self._modules, 'button')
+        return self.__module_list('button')
 
     @property
     def dials(self) -> ModuleList:
         """Module List of connected Dial modules.
         """
-        return ModuleList(self._modules, "dial")
+        return self.__module_list('dial')
 
     @property
     def displays(self) -> ModuleList:
         """Module List of connected Display modules.
         """
-        return ModuleList(self._modules, "display")
+        return self.__module_list('display')
 
     @property
     def envs(self) -> ModuleList:
         """Module List of connected Env modules.
         """
-        return ModuleList(self._modules, "env")
+        return self.__module_list('env')
 
     @property
     def gyros(self) -> ModuleList:
         """Module List of connected Gyro modules.
         """
-        return ModuleList(self._modules, "gyro")
+        return self.__module_list('gyro')
 
     @property
     def irs(self) -> ModuleList:
         """Module List of connected Ir modules.
         """
-        return ModuleList(self._modules, "ir")
+        return self.__module_list('ir')
 
     @property
     def leds(self) -> ModuleList:
         """Module List of connected Led modules.
         """
-        return ModuleList(self._modules, "led")
+        return self.__module_list('led')
 
     @property
     def mics(self) -> ModuleList:
         """Module List of connected Mic modules.
         """
-        return ModuleList(self._modules, "mic")
+        return self.__module_list('mic')
 
     @property
     def motors(self) -> ModuleList:
         """Module List of connected Motor modules.
         """
-        return ModuleList(self._modules, "motor")
+        return self.__module_list('motor')
 
     @property
     def speakers(self) -> ModuleList:
         """Module List of connected Speaker modules.
         """
-        return ModuleList(self._modules, "speaker")
+        return self.__module_list('speaker')
 
     @property
     def ultrasonics(self) -> ModuleList:
         """Module List of connected Ultrasonic modules.
         """
-        return ModuleList(self._modules, "ultrasonic")
+        return self.__module_list('ultrasonic')
 
 
 def update_module_firmware(target_ids=(0xFFF, )):
-    updater = STM32FirmwareUpdater(target_ids=target_ids)
+    updater = im('modi.util.firmware_updater').STM32FirmwareUpdater(
+        target_ids=target_ids
+    )
     updater.update_module_firmware()
     updater.close()
 
 
 def reset_module_firmware(target_ids=(0xFFF, )):
-    updater = STM32FirmwareUpdater(is_os_update=False, target_ids=target_ids)
+    updater = im('modi.util.firmware_updater').STM32FirmwareUpdater(
+        is_os_update=False, target_ids=target_ids
+    )
     updater.update_module_firmware()
     updater.close()
 
 
 def update_network_firmware(force=False):
-    updater = ESP32FirmwareUpdater()
+    updater = im('modi.util.firmware_updater').ESP32FirmwareUpdater()
     updater.update_firmware(force=force)
@@ -13,6 +13,8 @@ class CanTask(ConnTask):
 
     _instances = set()
 
+    RECV_BLOCKS = True
+
     def __init__(self, verbose=False):
         super().__init__(verbose)
         print("Initiating can connection...")
@@ -1,11 +1,14 @@
 import time
 from abc import ABC
 from abc import abstractmethod
-from typing import Optional
+from typing import Optional, Union
 
 
 class ConnTask(ABC):
 
+    # True if recv() itself waits for incoming data before returning None
+    RECV_BLOCKS = False
+
     def __init__(self, verbose=False):
         self._bus = None
         self.verbose = verbose
@@ -33,7 +36,7 @@ class ConnTask(ABC):
         pass
 
     @abstractmethod
-    def recv(self) -> Optional[str]:
+    def recv(self) -> Optional[Union[str, bytes]]:
         pass
 
     @abstractmethod
@@ -48,6 +51,9 @@ class ConnTask(ABC):
         def decorator(self, pkt: str) -> None:
             init_time = time.perf_counter()
             func(self, pkt)
-            while time.perf_counter() - init_time < 0.04:
-                pass
+            # Sleep out the rest of the pacing interval rather than spinning,
+            # so the executor thread can keep draining the connection
+            remaining = 0.04 - (time.perf_counter() - init_time)
+            if remaining > 0:
+                time.sleep(remaining)
         return decorator
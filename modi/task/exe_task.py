@@ -1,7 +1,11 @@
-import json
 import time
 from base64 import b64decode
 
+try:
+    import orjson as json
+except ImportError:
+    import json
+
 from modi.module.module import Module, BROADCAST_ID
 from modi.module.setup_module.battery import Battery
 from modi.util.miscellaneous import get_module_from_name
@@ -16,6 +20,15 @@ class ExeTask:
         self._topology_data = topology_data
         self._conn = conn_task
 
+        # Command code to handler, built once rather than on every message
+        self.__command_handlers = {
+            0x00: self.__update_health,
+            0x05: self.__update_modules,
+            0x07: self.__update_topology,
+            0x1F: self.__update_property,
+            0xA1: self.__update_esp_version,
+        }
+
         # Reboot all modules
         self.__set_module_state(
             BROADCAST_ID, Module.REBOOT, Module.PNP_OFF
@@ -34,12 +47,14 @@ class ExeTask:
         """
         json_pkt = self._conn.recv()
         if not json_pkt:
-            time.sleep(delay)
+            # Connections that already waited for data need no extra sleep
+            if not self._conn.RECV_BLOCKS:
+                time.sleep(delay)
         else:
             try:
                 json_msg = json.loads(json_pkt)
                 self.__command_handler(json_msg['c'])(json_msg)
-            except json.decoder.JSONDecodeError:
+            except (json.JSONDecodeError, UnicodeDecodeError):
                 print('current json message:', json_pkt)
 
     def __command_handler(self, command):
@@ -50,13 +65,11 @@ class ExeTask:
         :return: a function the corresponds to the command code
         :rtype: Callable[[Dict[str, int]], None]
         """
-        return {
-            0x00: self.__update_health,
-            0x05: self.__update_modules,
-            0x07: self.__update_topology,
-            0x1F: self.__update_property,
-            0xA1: self.__update_esp_version,
-        }.get(command, lambda _: None)
+        return self.__command_handlers.get(command, self.__ignore_message)
+
+    @staticmethod
+    def __ignore_message(message):
+        pass
 
     def __update_esp_version(self, message):
         network_module = None
@@ -169,7 +182,6 @@ class ExeTask:
             new_module = self.__add_new_module(
                 module_type, module_id, module_uuid, module_version_info
             )
-            new_module.module_type = module_type
             if module_type != 'network' and not new_module.is_up_to_date:
                 print(f"{str(new_module)} is not up to date. "
                       f"Please update the module by calling "
@@ -191,6 +203,7 @@ class ExeTask:
         self.__set_module_state(module_instance.id, Module.RUN,
                                 Module.PNP_OFF)
         module_instance.version = module_version_info
+        module_instance.module_type = module_type
         self._modules.append(module_instance)
         print(f"{str(module_instance)} has been connected!")
         return module_instance
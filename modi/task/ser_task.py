@@ -1,4 +1,7 @@
-from typing import Optional
+import os
+import errno
+import selectors
+from typing import Optional, Union
 
 import serial
 from serial.serialutil import SerialException
@@ -8,11 +11,14 @@ from modi.util.connection_util import list_modi_ports
 
 class SerTask(ConnTask):
 
+    RECV_BLOCKS = True
+
     def __init__(self, verbose=False, port=None):
         print("Initiating serial connection...")
         super().__init__(verbose)
         self.__port = port
-        self.__json_buffer = b''
+        self.__json_buffer = bytearray()
+        self.__selector = None
 
     #
     # Inherited Methods
@@ -22,7 +28,20 @@ class SerTask(ConnTask):
 
         :return: None
         """
-        modi_ports = list_modi_ports()
+        try:
+            self.__open_modi_port(list_modi_ports())
+        except SerialException:
+            # The cached port list may predate a re-enumeration of the ports
+            # (e.g. a reboot into the bootloader), so retry on a fresh scan
+            self.__open_modi_port(list_modi_ports(use_cache=False))
+
+    def __open_modi_port(self, modi_ports) -> None:
+        """ Open the MODI port to use among the given ports
+
+        :param modi_ports: Connected MODI ports
+        :type modi_ports: List[ListPortInfo]
+        :return: None
+        """
         if not modi_ports:
             raise SerialException("No MODI network module is available")
 
@@ -34,6 +53,7 @@ class SerTask(ConnTask):
                 try:
                     self._bus = self.__init_serial(self.__port)
                     self._bus.open()
+                    self.__init_selector()
                     return
                 except SerialException:
                     raise SerialException(f"{self.__port} is not available.")
@@ -42,6 +62,7 @@ class SerTask(ConnTask):
             self._bus = self.__init_serial(modi_port.device)
             try:
                 self._bus.open()
+                self.__init_selector()
                 print(f'Serial is open at "{modi_port}"')
                 return
             except SerialException:
@@ -53,35 +74,84 @@ class SerTask(ConnTask):
         ser = serial.Serial(exclusive=True)
         ser.baudrate = 921600
         ser.port = port
+        ser.timeout = 0.05
         ser.write_timeout = 0
         return ser
 
+    def __init_selector(self) -> None:
+        """ Watch the serial fd for readability where the OS supports it,
+        Windows keeps using pyserial's own read
+
+        :return: None
+        """
+        if os.name == 'nt':
+            return
+        self.__selector = selectors.DefaultSelector()
+        self.__selector.register(self._bus.fileno(), selectors.EVENT_READ)
+
+        # Bound once here, as __read runs on every executor iteration
+        self.__select = self.__selector.select
+        self.__fd = self._bus.fileno()
+        self.__read_timeout = self._bus.timeout
+
+        # Reads land in this buffer instead of a fresh bytes per call
+        self.__recv_buf = [memoryview(bytearray(4096))]
+
+    def __read(self) -> Union[bytes, memoryview]:
+        """ Wait up to the read timeout for incoming bytes and read them,
+        a returned memoryview is only valid until the next call
+
+        :return: bytes or memoryview
+        """
+        if not self.__selector:
+            bus = self._bus
+            return bus.read(bus.in_waiting or 1)
+        if not self.__select(self.__read_timeout):
+            return b''
+        try:
+            nbytes = os.readv(self.__fd, self.__recv_buf)
+        except OSError as e:
+            # Spurious wakeups and interrupts mean no data, as in pyserial
+            if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+                return b''
+            raise SerialException(f"read failed: {e}")
+        if not nbytes:
+            # Readable but empty means the device has been disconnected
+            raise SerialException("Serial device returned no data")
+        return self.__recv_buf[0][:nbytes]
+
     def close_conn(self) -> None:
         """ Close serial port
 
         :return: None
         """
+        if self.__selector:
+            self.__selector.close()
+            self.__selector = None
         self._bus.close()
 
-    def recv(self) -> Optional[str]:
+    def recv(self) -> Optional[bytes]:
         """ Read serial message and put message to serial read queue
 
-        :return: str
+        :return: bytes
         """
-        buf_temp = self._bus.read_all()
-        self.__json_buffer += buf_temp
-        idx = self.__json_buffer.find(b'{')
-        if idx < 0:
-            self.__json_buffer = b''
+        # Block for the first byte (up to the read timeout) only when no
+        # complete packet is buffered, then drain whatever has arrived
+        json_buffer = self.__json_buffer
+        if b'}' not in json_buffer:
+            json_buffer.extend(self.__read())
+        begin = json_buffer.find(b'{')
+        if begin < 0:
+            json_buffer.clear()
             return None
-        self.__json_buffer = self.__json_buffer[idx:]
-        idx = self.__json_buffer.find(b'}')
-        if idx < 0:
+        end = json_buffer.find(b'}', begin)
+        if end < 0:
+            del json_buffer[:begin]
             return None
-        json_pkt = self.__json_buffer[:idx + 1].decode('utf8')
-        self.__json_buffer = self.__json_buffer[idx + 1:]
+        json_pkt = bytes(json_buffer[begin:end + 1])
+        del json_buffer[:end + 1]
         if self.verbose:
-            print(f'recv: {json_pkt}')
+            print(f'recv: {json_pkt.decode("utf8")}')
         return json_pkt
 
     @ConnTask.wait
@@ -1,16 +1,20 @@
 
+import select
 import socket
 
 from modi.task.conn_task import ConnTask
+from modi.util.connection_util import MODIConnectionError
 
 
 class VirTask(ConnTask):
 
+    RECV_BLOCKS = True
+
     def __init__(self, verbose=False, port=12345):
         print("Initiating virtual connection...")
         super().__init__(verbose)
         self._bus = self.VirBus(serv_info=('127.0.0.1', port))
-        self.__json_buffer = b''
+        self.__json_buffer = bytearray()
 
     class VirBus:
         """
@@ -19,12 +23,14 @@ class VirTask(ConnTask):
         """
 
         RECV_BUFF_SIZE = 1024
+        RECV_TIMEOUT = 0.05
 
         def __init__(self, serv_info=('127.0.0.1', 12345)):
             # VirtualBundle asynchronously generates MODI messages
             self._s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
 
             self.serv_host, self.serv_port = serv_info
+            self._recv_view = memoryview(bytearray(self.RECV_BUFF_SIZE))
 
         def open(self):
             # Open client, PyMODI Side
@@ -39,8 +45,16 @@ class VirTask(ConnTask):
             self._s.sendall(msg)
 
         def read(self):
-            # Flush all stacked messages from the virtual bundle
-            return self._s.recv(self.RECV_BUFF_SIZE)
+            # Flush all stacked messages from the virtual bundle, the view
+            # returned is only valid until the next read. Waiting is bounded,
+            # so that the executor thread can still notice a close request
+            if not select.select([self._s], [], [], self.RECV_TIMEOUT)[0]:
+                return b''
+            nbytes = self._s.recv_into(self._recv_view)
+            if not nbytes:
+                # Readable but empty means the virtual bundle has closed
+                raise MODIConnectionError("Virtual bundle has disconnected")
+            return self._recv_view[:nbytes]
 
         def __read_all(self):
             data = bytearray()
@@ -72,17 +86,18 @@ class VirTask(ConnTask):
             print(f'send: {pkt}')
 
     def recv(self):
-        self.__json_buffer += self._bus.read()
-        idx = self.__json_buffer.find(b'{')
-        if idx < 0:
-            self.__json_buffer = b''
+        json_buffer = self.__json_buffer
+        json_buffer.extend(self._bus.read())
+        begin = json_buffer.find(b'{')
+        if begin < 0:
+            json_buffer.clear()
             return None
-        self.__json_buffer = self.__json_buffer[idx:]
-        idx = self.__json_buffer.find(b'}')
-        if idx < 0:
+        end = json_buffer.find(b'}', begin)
+        if end < 0:
+            del json_buffer[:begin]
             return None
-        json_pkt = self.__json_buffer[:idx + 1].decode('utf8')
-        self.__json_buffer = self.__json_buffer[idx + 1:]
+        json_pkt = bytes(json_buffer[begin:end + 1])
+        del json_buffer[:end + 1]
         if self.verbose:
-            print(f'recv: {json_pkt}')
+            print(f'recv: {json_pkt.decode("utf8")}')
         return json_pkt
@@ -1,32 +1,54 @@
 import os
-from typing import List
+import time
+from functools import lru_cache
+from typing import List, Tuple
 
 import serial.tools.list_ports as stl
 from serial.tools.list_ports_common import ListPortInfo
 
 
-def list_modi_ports() -> List[ListPortInfo]:
+MODI_PRODUCTS = frozenset((
+    "MODI Network Module",
+    "MODI Network Module(BootLoader)",
+    "STM32 Virtual ComPort",
+    "STMicroelectronics Virtual COM Port",
+))
+MODI_USB_IDS = frozenset(((0x2fde, 0x2), (0x483, 0x5740)))
+
+
+def __is_modi_port(port: ListPortInfo) -> bool:
+    return (
+        (port.manufacturer and port.manufacturer.upper() == "LUXROBO")
+        or port.product in MODI_PRODUCTS
+        or (port.vid, port.pid) in MODI_USB_IDS
+    )
+
+
+@lru_cache(maxsize=1)
+def __scan_modi_ports(_time_bucket: int) -> Tuple[ListPortInfo, ...]:
+    return tuple(port for port in stl.comports() if __is_modi_port(port))
+
+
+def list_modi_ports(use_cache: bool = True) -> List[ListPortInfo]:
     """Returns a list of connected MODI ports
 
+    A scan which found MODI ports is reused for up to 5 seconds, since
+    enumerating system ports is slow on some platforms (e.g. WMI on
+    Windows). An empty scan is never reused.
+
+    :param use_cache: False to rescan, e.g. after the ports re-enumerate
+    :type use_cache: bool
     :return: List[ListPortInfo]
     """
-
-    def __is_modi_port(port):
-        return (
-            (port.manufacturer and port.manufacturer.upper() == "LUXROBO")
-            or port.product in (
-                "MODI Network Module",
-                "MODI Network Module(BootLoader)",
-                "STM32 Virtual ComPort",
-                "STMicroelectronics Virtual COM Port",
-            )
-            or (port.vid == 0x2fde and port.pid == 0x2)
-            or (port.vid == 0x483 and port.pid == 0x5740)
-        )
-
-    return [port for port in stl.comports() if __is_modi_port(port)]
+    if not use_cache:
+        __scan_modi_ports.cache_clear()
+    modi_ports = __scan_modi_ports(int(time.time()) // 5)
+    if not modi_ports:
+        __scan_modi_ports.cache_clear()
+    return list(modi_ports)
 
 
+@lru_cache(maxsize=1)
 def is_on_pi() -> bool:
     """Returns whether connected to pi
 
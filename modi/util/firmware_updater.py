@@ -127,6 +127,8 @@ class STM32FirmwareUpdater:
 
         print('Re-init serial connection for the update, in 2 seconds...')
         time.sleep(2)
+        # Ports may have re-enumerated while the module rebooted
+        list_modi_ports(use_cache=False)
         self.__conn = self.__open_conn()
         self.__conn.open_conn()
         self.__running = True
@@ -1107,6 +1109,8 @@ class GD32FirmwareUpdater:
 
         print('Re-init serial connection for the update, in 2 seconds...')
         time.sleep(2)
+        # Ports may have re-enumerated while the module rebooted
+        list_modi_ports(use_cache=False)
         self.__conn = self.__open_conn()
         self.__conn.open_conn()
         self.__running = True
@@ -1,8 +1,18 @@
-import json
 import struct
 from base64 import b64encode, b64decode
 from typing import Tuple
 
+try:
+    import orjson as json
+
+    def __dumps(obj) -> str:
+        return json.dumps(obj).decode('utf8')
+except ImportError:
+    import json
+
+    def __dumps(obj) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
 
 def parse_message(command: int, source: int, destination: int,
                   byte_data: Tuple =
@@ -13,7 +23,7 @@ def parse_message(command: int, source: int, destination: int,
     message['d'] = destination
     message['b'] = __encode_bytes(byte_data)
     message['l'] = len(byte_data)
-    return json.dumps(message, separators=(",", ":"))
+    return __dumps(message)
 
 
 def __extract_length(begin: int, src: Tuple) -> int:
@@ -1,3 +1,4 @@
+from collections import defaultdict
 from importlib.util import find_spec
 
 
@@ -49,6 +50,25 @@ def ask_modi_device(devices):
     return devices[int(i)].lstrip('MODI_')
 
 
+class ModuleIndex(list):
+    """ List of modules which also keeps them indexed by module type,
+    so that ModuleList does not scan every module on each access
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.__by_type = defaultdict(list)
+
+    def append(self, module):
+        # Index first, so a reader never sees the module counted in the
+        # list but missing from its type
+        self.__by_type[module.module_type].append(module)
+        super().append(module)
+
+    def of_type(self, module_type):
+        return list(self.__by_type.get(module_type, ()))
+
+
 class ModuleList(list):
 
     def __init__(self, src, module_type=None):
@@ -77,7 +97,9 @@ class ModuleList(list):
 
         :return: Module
         """
-        if self.__module_type:
+        if self.__module_type and isinstance(self.__src, ModuleIndex):
+            modules = self.__src.of_type(self.__module_type)
+        elif self.__module_type:
             modules = list(
                 filter(
                     lambda module: module.module_type == self.__module_type,
@@ -1,5 +1,5 @@
 import time
-from typing import Tuple
+from typing import Callable, Tuple
 
 from modi.module.output_module.display import Display
 from modi.module.output_module.led import Led
@@ -7,29 +7,31 @@ from modi.module.output_module.speaker import Speaker
 from modi.module.input_module.dial import Dial
 
 
-def update_screen(pos: Tuple[int, int],
-                  vel: Tuple[int, int], bar: int,
-                  display: Display) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+def update_screen(x: int, y: int, vx: int, vy: int, bar: int,
+                  show_variable: Callable) -> Tuple[int, int, int, int]:
     """Update the screen of the display module after moving the ball
 
-    :param pos: Position of the ball
-    :param vel: Velocity of the ball
+    :param x: X position of the ball
+    :param y: Y position of the ball
+    :param vx: X velocity of the ball
+    :param vy: Y velocity of the ball
     :param bar: Position of the bar
-    :param display: Reference to display module
-    :return: Tuple[Tuple[int, int], Tuple[int, int]]
+    :param show_variable: Bound show_variable method of the display module
+    :return: Tuple[int, int, int, int]
     """
-    display.show_variable(0, pos[0], pos[1])
-    display.show_variable(1, bar, 60)
-    pos = (pos[0] + vel[0], pos[1] + vel[1])
-    if pos[0] < 0 or pos[0] > 40:
-        vel = (-vel[0], vel[1])
-    if pos[1] < 0 or pos[1] > 55:
-        vel = (vel[0], -vel[1])
-    if pos[1] < 0:
-        pos = (pos[0], 0)
-    if pos[0] < 0:
-        pos = (0, pos[1])
-    return pos, vel
+    show_variable(0, x, y)
+    show_variable(1, bar, 60)
+    x += vx
+    y += vy
+    if not 0 <= x <= 40:
+        vx = -vx
+    if not 0 <= y <= 55:
+        vy = -vy
+    if y < 0:
+        y = 0
+    if x < 0:
+        x = 0
+    return x, y, vx, vy
 
 
 def initialize(display: Display, led: Led, speaker: Speaker,
@@ -42,25 +44,27 @@ def initialize(display: Display, led: Led, speaker: Speaker,
     :param dial: Dial module
     :return: Score
     """
-    ball_pos = (20, 30)
-    ball_vel = (1, -1)
+    x, y, vx, vy = 20, 30, 1, -1
     led.rgb = 0, 50, 0
     score = 0
+
+    # Bind per-frame lookups once, outside of the game loop
+    show_variable = display.show_variable
+    clear = display.clear
+    sleep = time.sleep
     while True:
         bar_pos = int(50 * dial.degree / 100)
-        ball_pos, ball_vel = update_screen(ball_pos, ball_vel, bar_pos,
-                                           display)
-        time.sleep(0.02)
-        if ball_pos[1] > 55 and (ball_pos[0] > bar_pos + 10
-                                 or ball_pos[0] < bar_pos - 10):
+        x, y, vx, vy = update_screen(x, y, vx, vy, bar_pos, show_variable)
+        sleep(0.02)
+        if y > 55 and (x > bar_pos + 10 or x < bar_pos - 10):
             led.rgb = 50, 0, 0
             break
-        elif ball_pos[1] > 55:
+        elif y > 55:
             speaker.tune = 700, 100
-            time.sleep(0.1)
+            sleep(0.1)
             speaker.volume = 0
             score += 1
-        display.clear()
+        clear()
     return score
 
 
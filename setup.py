@@ -32,7 +32,7 @@ setup(
     long_description=get_readme() + '\n' + get_history(),
     long_description_content_type='text/markdown',
     install_requires=get_requirements(),
-    extras_require={'dev': get_requirements_dev()},
+    extras_require={'dev': get_requirements_dev(), 'fast': ['orjson']},
     license=about['__license__'],
     include_package_data=True,
     keywords=['python', 'modi'],
@@ -1,20 +1,30 @@
+import os
+import errno
+import threading
+import time
 import unittest
 
 from unittest import mock
 
+from serial.serialutil import SerialException
+
 from modi.task.ser_task import SerTask
 
+if os.name != 'nt':
+    import pty
+    import tty
+
 
 class TestSerTask(unittest.TestCase):
     """Tests for 'SerTask' class"""
     class MockSerial:
         def __init__(self):
             self.in_waiting = 1
-            self.read_all = mock.Mock(side_effect=self.read_mock)
+            self.read = mock.Mock(side_effect=self.read_mock)
             self.write = mock.Mock()
             self.close = mock.Mock()
 
-        def read_mock(self):
+        def read_mock(self, size=1):
             self.in_waiting = 0
             return b'{complete}'
 
@@ -35,7 +45,7 @@ class TestSerTask(unittest.TestCase):
     def test_recv_data(self):
         """Test _read_data method"""
         self.ser_task._bus = self.MockSerial()
-        self.assertEqual(self.ser_task.recv(), '{complete}')
+        self.assertEqual(self.ser_task.recv(), b'{complete}')
 
     def test_send_data(self):
         """Test _write_data method"""
@@ -44,5 +54,99 @@ class TestSerTask(unittest.TestCase):
         self.ser_task.bus.write.assert_called_once_with("foo".encode())
 
 
+@unittest.skipIf(os.name == 'nt', "Serial fd selector is POSIX only")
+class TestSerTaskSelector(unittest.TestCase):
+    """Tests for 'SerTask' reading through the serial fd selector"""
+    class PtySerial:
+        def __init__(self):
+            self.master, self.slave = pty.openpty()
+            tty.setraw(self.slave)
+            self.timeout = 0.05
+
+        def fileno(self):
+            return self.slave
+
+        def close(self):
+            os.close(self.slave)
+            os.close(self.master)
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        self.ser_task = SerTask()
+        self.ser_task._bus = self.PtySerial()
+        self.ser_task._SerTask__init_selector()
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+        self.ser_task.close_conn()
+        del self.ser_task
+
+    def __write(self, data):
+        os.write(self.ser_task.bus.master, data)
+
+    def __recv_packets(self, nb_packets, timeout=2):
+        packets = []
+        deadline = time.time() + timeout
+        while len(packets) < nb_packets and time.time() < deadline:
+            json_pkt = self.ser_task.recv()
+            if json_pkt:
+                packets.append(json_pkt)
+        return packets
+
+    def test_recv_no_data(self):
+        """Test recv waits for the read timeout when no data arrives"""
+        init_time = time.perf_counter()
+        self.assertIsNone(self.ser_task.recv())
+        self.assertGreaterEqual(time.perf_counter() - init_time, 0.04)
+
+    def test_recv_split_packet(self):
+        """Test recv frames a packet split across reads"""
+        self.__write(b'{"c":1,')
+        self.assertIsNone(self.ser_task.recv())
+        self.__write(b'"s":2}')
+        self.assertEqual(self.__recv_packets(1), [b'{"c":1,"s":2}'])
+
+    def test_recv_skips_garbage(self):
+        """Test recv skips bytes outside of packets"""
+        self.__write(b'}xx{"c":1}garbage{"c":2}')
+        self.assertEqual(
+            self.__recv_packets(2), [b'{"c":1}', b'{"c":2}']
+        )
+
+    def test_recv_large_burst(self):
+        """Test recv returns every packet of a burst over 4096 bytes"""
+        expected = [
+            ('{"c":31,"s":%d,"d":4095,"b":"AAAAAA=="}' % i).encode()
+            for i in range(300)
+        ]
+        burst = b''.join(expected)
+        self.assertGreater(len(burst), 4096)
+        writer = threading.Thread(target=self.__write, args=(burst, ))
+        writer.start()
+        packets = self.__recv_packets(len(expected))
+        writer.join()
+        self.assertEqual(packets, expected)
+
+    def test_recv_empty_read(self):
+        """Test recv raises when the readable fd returns no data"""
+        self.__write(b'{')
+        with mock.patch('modi.task.ser_task.os.readv', return_value=0):
+            self.assertRaises(SerialException, self.ser_task.recv)
+
+    def test_recv_spurious_wakeup(self):
+        """Test recv treats EAGAIN as no data"""
+        self.__write(b'{')
+        error = BlockingIOError(errno.EAGAIN, 'Resource unavailable')
+        with mock.patch('modi.task.ser_task.os.readv', side_effect=error):
+            self.assertIsNone(self.ser_task.recv())
+
+    def test_recv_read_error(self):
+        """Test recv raises read errors as SerialException"""
+        self.__write(b'{')
+        error = OSError(errno.EIO, 'Input/output error')
+        with mock.patch('modi.task.ser_task.os.readv', side_effect=error):
+            self.assertRaises(SerialException, self.ser_task.recv)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,45 @@
+import socket
+import time
+import unittest
+
+from modi.task.vir_task import VirTask
+from modi.util.connection_util import MODIConnectionError
+
+
+class TestVirTask(unittest.TestCase):
+    """Tests for 'VirTask' class"""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        self.vir_task = VirTask()
+        self.vir_task.bus._s.close()
+        self.vir_task.bus._s, self.peer = socket.socketpair()
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+        self.vir_task.close_conn()
+        self.peer.close()
+        del self.vir_task
+
+    def test_recv_data(self):
+        """Test recv method"""
+        self.peer.sendall(b'{"c":1}{"c":')
+        self.assertEqual(self.vir_task.recv(), b'{"c":1}')
+        self.assertIsNone(self.vir_task.recv())
+        self.peer.sendall(b'2}')
+        self.assertEqual(self.vir_task.recv(), b'{"c":2}')
+
+    def test_recv_no_data(self):
+        """Test recv waits for the read timeout when no data arrives"""
+        init_time = time.perf_counter()
+        self.assertIsNone(self.vir_task.recv())
+        self.assertGreaterEqual(time.perf_counter() - init_time, 0.04)
+
+    def test_recv_closed_peer(self):
+        """Test recv raises once the virtual bundle has closed"""
+        self.peer.close()
+        self.assertRaises(MODIConnectionError, self.vir_task.recv)
+
+
+if __name__ == "__main__":
+    unittest.main()
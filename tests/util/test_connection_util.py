@@ -0,0 +1,75 @@
+import unittest
+
+from unittest import mock
+
+from modi.util import connection_util
+from modi.util.connection_util import list_modi_ports
+
+
+class TestConnectionUtil(unittest.TestCase):
+    """Tests for 'connection_util' module"""
+
+    class MockPort:
+        def __init__(self, device, manufacturer=None, product=None,
+                     vid=None, pid=None):
+            self.device = device
+            self.manufacturer = manufacturer
+            self.product = product
+            self.vid = vid
+            self.pid = pid
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        # Keep every scan in the same 5 second cache bucket, stubbing only
+        # the time module seen by connection_util
+        time_patcher = mock.patch.object(connection_util, 'time')
+        time_patcher.start().time.return_value = 100.0
+        self.addCleanup(time_patcher.stop)
+        # Module level name, fetched by getattr to avoid name mangling
+        getattr(connection_util, '__scan_modi_ports').cache_clear()
+        self.modi_port = self.MockPort('modi', manufacturer='LUXROBO')
+        self.boot_port = self.MockPort('boot', vid=0x483, pid=0x5740)
+        self.other_port = self.MockPort('other', vid=0x1, pid=0x2)
+
+    def test_list_modi_ports(self):
+        """Test list_modi_ports method"""
+        ports = [self.other_port, self.modi_port, self.boot_port]
+        with mock.patch.object(connection_util.stl, 'comports',
+                               return_value=ports):
+            self.assertEqual(
+                list_modi_ports(use_cache=False),
+                [self.modi_port, self.boot_port]
+            )
+
+    def test_list_modi_ports_reuses_scan(self):
+        """Test list_modi_ports reuses a scan which found MODI ports"""
+        with mock.patch.object(connection_util.stl, 'comports',
+                               return_value=[self.modi_port]) as comports:
+            list_modi_ports()
+            list_modi_ports()
+            comports.assert_called_once_with()
+
+    def test_list_modi_ports_empty_scan_not_cached(self):
+        """Test list_modi_ports rescans after finding no MODI port"""
+        with mock.patch.object(connection_util.stl, 'comports',
+                               return_value=[self.other_port]):
+            self.assertEqual(list_modi_ports(), [])
+        with mock.patch.object(connection_util.stl, 'comports',
+                               return_value=[self.modi_port]):
+            self.assertEqual(list_modi_ports(), [self.modi_port])
+
+    def test_list_modi_ports_without_cache(self):
+        """Test list_modi_ports rescans when use_cache is False"""
+        with mock.patch.object(connection_util.stl, 'comports',
+                               return_value=[self.modi_port]):
+            list_modi_ports()
+        with mock.patch.object(connection_util.stl, 'comports',
+                               return_value=[self.boot_port]):
+            self.assertEqual(list_modi_ports(), [self.modi_port])
+            self.assertEqual(
+                list_modi_ports(use_cache=False), [self.boot_port]
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
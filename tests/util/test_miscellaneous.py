@@ -0,0 +1,52 @@
+import unittest
+
+from modi.module.input_module.button import Button
+from modi.module.output_module.led import Led
+from modi.util.miscellaneous import MockConn, ModuleIndex, ModuleList
+
+
+class TestModuleIndex(unittest.TestCase):
+    """Tests for 'ModuleIndex' and 'ModuleList' classes"""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        self.modules = ModuleIndex()
+        self.button = self.__add_module(Button, 1, 'button')
+        self.led = self.__add_module(Led, 2, 'led')
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+        del self.modules
+
+    def __add_module(self, module_class, module_id, module_type):
+        module = module_class(module_id, -1, MockConn())
+        module.module_type = module_type
+        self.modules.append(module)
+        return module
+
+    def test_of_type(self):
+        """Test of_type method"""
+        self.assertEqual(self.modules.of_type('button'), [self.button])
+        self.assertEqual(self.modules.of_type('led'), [self.led])
+        self.assertEqual(self.modules.of_type('dial'), [])
+
+    def test_of_type_returns_copy(self):
+        """Test of_type does not expose the index"""
+        self.modules.of_type('led').clear()
+        self.assertEqual(self.modules.of_type('led'), [self.led])
+
+    def test_module_list(self):
+        """Test ModuleList of a ModuleIndex"""
+        self.assertEqual(ModuleList(self.modules, 'led'), [self.led])
+        self.assertEqual(len(ModuleList(self.modules, 'dial')), 0)
+        self.assertEqual(len(ModuleList(self.modules)), 2)
+
+    def test_module_list_after_append(self):
+        """Test ModuleList sees a module appended later"""
+        led = self.__add_module(Led, 3, 'led')
+        self.assertEqual(len(ModuleList(self.modules, 'led')), 2)
+        self.assertIn(led, ModuleList(self.modules, 'led'))
+
+
+if __name__ == "__main__":
+    unittest.main()